@@ -13,10 +13,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import is_list_like, is_dict_like, is_string, unic
+from operator import attrgetter
+
+from robot.utils import is_dict_like, is_integer, is_list_like, is_string, unic
 
 
 class ListenerArguments(object):
+    __slots__ = ['_arguments', '_version2', '_version3']
 
     def __init__(self, arguments):
         self._arguments = arguments
@@ -39,20 +42,20 @@ class ListenerArguments(object):
     def _get_version3_arguments(self, *arguments):
         return arguments
 
-    @classmethod
-    def by_method_name(cls, name, arguments):
-        Arguments = {'start_suite': StartSuiteArguments,
-                     'end_suite': EndSuiteArguments,
-                     'start_test': StartTestArguments,
-                     'end_test': EndTestArguments,
-                     'start_keyword': StartKeywordArguments,
-                     'end_keyword': EndKeywordArguments,
-                     'log_message': MessageArguments,
-                     'message': MessageArguments}.get(name, ListenerArguments)
-        return Arguments(arguments)
+    @staticmethod
+    def class_by_method_name(name):
+        return {'start_suite': StartSuiteArguments,
+                'end_suite': EndSuiteArguments,
+                'start_test': StartTestArguments,
+                'end_test': EndTestArguments,
+                'start_keyword': StartKeywordArguments,
+                'end_keyword': EndKeywordArguments,
+                'log_message': MessageArguments,
+                'message': MessageArguments}.get(name, ListenerArguments)
 
 
 class MessageArguments(ListenerArguments):
+    __slots__ = []
 
     def _get_version2_arguments(self, msg):
         attributes = {'timestamp': msg.timestamp,
@@ -66,19 +69,27 @@ class MessageArguments(ListenerArguments):
 
 
 class _ListenerArgumentsFromItem(ListenerArguments):
+    __slots__ = []
     _attribute_names = None
+    _get_attribute_values = None
 
     def _get_version2_arguments(self, item):
-        attributes = dict((name, self._get_attribute_value(item, name))
-                          for name in self._attribute_names)
+        values = self._get_attribute_values(item)
+        attributes = {}
+        for name, value in zip(self._attribute_names, values):
+            attributes[name] = self._take_copy_of_mutable_value(value)
         attributes.update(self._get_extra_attributes(item))
         return item.name, attributes
 
-    def _get_attribute_value(self, item, name):
-        value = getattr(item, name)
-        return self._take_copy_of_mutable_value(value)
-
     def _take_copy_of_mutable_value(self, value):
+        # Most values are strings, numbers or `None`. Checking them first
+        # avoids the relatively expensive generic checks below.
+        if is_string(value) or is_integer(value) or value is None:
+            return value
+        if type(value) is list:
+            return value[:]
+        if type(value) is dict:
+            return value.copy()
         if is_dict_like(value):
             return dict(value)
         if is_list_like(value):
@@ -93,7 +104,9 @@ class _ListenerArgumentsFromItem(ListenerArguments):
 
 
 class StartSuiteArguments(_ListenerArgumentsFromItem):
+    __slots__ = []
     _attribute_names = ('id', 'longname', 'doc', 'metadata', 'starttime')
+    _get_attribute_values = attrgetter(*_attribute_names)
 
     def _get_extra_attributes(self, suite):
         return {'tests': [t.name for t in suite.tests],
@@ -103,8 +116,10 @@ class StartSuiteArguments(_ListenerArgumentsFromItem):
 
 
 class EndSuiteArguments(StartSuiteArguments):
+    __slots__ = []
     _attribute_names = ('id', 'longname', 'doc', 'metadata', 'starttime',
                         'endtime', 'elapsedtime', 'status', 'message')
+    _get_attribute_values = attrgetter(*_attribute_names)
 
     def _get_extra_attributes(self, suite):
         attrs = StartSuiteArguments._get_extra_attributes(self, suite)
@@ -113,7 +128,9 @@ class EndSuiteArguments(StartSuiteArguments):
 
 
 class StartTestArguments(_ListenerArgumentsFromItem):
+    __slots__ = []
     _attribute_names = ('id', 'longname', 'doc', 'tags', 'starttime')
+    _get_attribute_values = attrgetter(*_attribute_names)
 
     def _get_extra_attributes(self, test):
         return {'critical': 'yes' if test.critical else 'no',
@@ -122,13 +139,17 @@ class StartTestArguments(_ListenerArgumentsFromItem):
 
 
 class EndTestArguments(StartTestArguments):
+    __slots__ = []
     _attribute_names = ('id', 'longname', 'doc', 'tags', 'starttime',
                         'endtime', 'elapsedtime', 'status', 'message')
+    _get_attribute_values = attrgetter(*_attribute_names)
 
 
 class StartKeywordArguments(_ListenerArgumentsFromItem):
+    __slots__ = []
     _attribute_names = ('kwname', 'libname', 'doc', 'assign', 'tags',
                         'starttime')
+    _get_attribute_values = attrgetter(*_attribute_names)
     _types = {'kw': 'Keyword', 'setup': 'Setup', 'teardown': 'Teardown',
               'for': 'For', 'foritem': 'For Item'}
 
@@ -138,5 +159,7 @@ class StartKeywordArguments(_ListenerArgumentsFromItem):
 
 
 class EndKeywordArguments(StartKeywordArguments):
-    _attribute_names = ('kwname', 'libname', 'doc', 'args', 'assign', 'tags',
+    __slots__ = []
+    _attribute_names = ('kwname', 'libname', 'doc', 'assign', 'tags',
                         'starttime', 'endtime', 'elapsedtime', 'status')
+    _get_attribute_values = attrgetter(*_attribute_names)
@@ -26,6 +26,7 @@ class ListenerMethods(object):
     def __init__(self, method_name, listeners):
         self._methods = []
         self._method_name = method_name
+        self._arguments = ListenerArguments.class_by_method_name(method_name)
         if listeners:
             self._register_methods(method_name, listeners)
 
@@ -36,20 +37,26 @@ class ListenerMethods(object):
                 self._methods.append(ListenerMethod(method, listener))
 
     def __call__(self, *args):
-        if self._methods:
-            args = ListenerArguments.by_method_name(self._method_name, args)
-            for method in self._methods:
-                method(args.get_arguments(method.version))
+        if self._methods and not ListenerMethod.called:
+            args = self._arguments(args)
+            ListenerMethod.called = True
+            try:
+                for method in self._methods:
+                    method(args.get_arguments(method.version))
+            finally:
+                ListenerMethod.called = False
 
     def __nonzero__(self):
         return bool(self._methods)
 
 
+@py2to3
 class LibraryListenerMethods(object):
 
     def __init__(self, method_name):
         self._method_stack = []
         self._method_name = method_name
+        self._arguments = ListenerArguments.class_by_method_name(method_name)
 
     def new_suite_scope(self):
         self._method_stack.append([])
@@ -70,11 +77,17 @@ class LibraryListenerMethods(object):
         self._method_stack[-1] = methods
 
     def __call__(self, *args, **conf):
+        if ListenerMethod.called:
+            return
         methods = self._get_methods(**conf)
         if methods:
-            args = ListenerArguments.by_method_name(self._method_name, args)
-            for method in methods:
-                method(args.get_arguments(method.version))
+            args = self._arguments(args)
+            ListenerMethod.called = True
+            try:
+                for method in methods:
+                    method(args.get_arguments(method.version))
+            finally:
+                ListenerMethod.called = False
 
     def _get_methods(self, library=None):
         if not (self._method_stack and self._method_stack[-1]):
@@ -84,9 +97,13 @@ class LibraryListenerMethods(object):
             return [m for m in methods if m.library is library]
         return methods
 
+    def __nonzero__(self):
+        return bool(self._method_stack and self._method_stack[-1])
+
 
 class ListenerMethod(object):
-    # Flag to avoid recursive listener calls.
+    # Flag to avoid recursive listener calls. Set by `ListenerMethods` and
+    # `LibraryListenerMethods` once per event, not separately per listener.
     called = False
 
     def __init__(self, method, listener, library=None):
@@ -96,10 +113,7 @@ class ListenerMethod(object):
         self.library = library
 
     def __call__(self, args):
-        if self.called:
-            return
         try:
-            ListenerMethod.called = True
             self.method(*args)
         except TimeoutError:
             # Propagate possible timeouts:
@@ -110,5 +124,3 @@ class ListenerMethod(object):
             LOGGER.error("Calling method '%s' of listener '%s' failed: %s"
                          % (self.method.__name__, self.listener_name, message))
             LOGGER.info("Details:\n%s" % details)
-        finally:
-            ListenerMethod.called = False
@@ -36,8 +36,16 @@ class Listeners(object):
         self._is_logged = IsLogged(log_level)
         listeners = ListenerProxy.import_listeners(listeners,
                                                    self._method_names)
+        self._listener_methods = []
+        self._import_methods = {}
+        self._file_methods = {}
         for name in self._method_names:
             method = ListenerMethods(name, listeners)
+            self._listener_methods.append(method)
+            if name.endswith('_import'):
+                self._import_methods[name.split('_')[0]] = method
+            elif name.endswith('_file'):
+                self._file_methods[name.split('_')[0]] = method
             if name.endswith(('_file', '_import', 'log_message')):
                 name = '_' + name
             setattr(self, name, method)
@@ -46,20 +54,17 @@ class Listeners(object):
         self._is_logged.set_level(level)
 
     def log_message(self, msg):
-        if self._is_logged(msg.level):
+        if self._log_message and self._is_logged(msg.level):
             self._log_message(msg)
 
     def imported(self, import_type, name, attrs):
-        method = getattr(self, '_%s_import' % import_type.lower())
-        method(name, attrs)
+        self._import_methods[import_type.lower()](name, attrs)
 
     def output_file(self, file_type, path):
-        method = getattr(self, '_%s_file' % file_type.lower())
-        method(path)
+        self._file_methods[file_type.lower()](path)
 
     def __nonzero__(self):
-        return any(isinstance(method, ListenerMethods) and method
-                   for method in self.__dict__.values())
+        return any(self._listener_methods)
 
 
 class LibraryListeners(object):
@@ -69,8 +74,10 @@ class LibraryListeners(object):
 
     def __init__(self, log_level='INFO'):
         self._is_logged = IsLogged(log_level)
+        self._listener_methods = []
         for name in self._method_names:
             method = LibraryListenerMethods(name)
+            self._listener_methods.append(method)
             if name == 'log_message':
                 name = '_' + name
             setattr(self, name, method)
@@ -80,32 +87,28 @@ class LibraryListeners(object):
                                                    self._method_names,
                                                    prefix='_',
                                                    raise_on_error=True)
-        for method in self._listener_methods():
+        for method in self._listener_methods:
             method.register(listeners, library)
 
-    def _listener_methods(self):
-        return [method for method in self.__dict__.values()
-                if isinstance(method, LibraryListenerMethods)]
-
     def unregister(self, library, close=False):
         if close:
             self.close(library=library)
-        for method in self._listener_methods():
+        for method in self._listener_methods:
             method.unregister(library)
 
     def new_suite_scope(self):
-        for method in self._listener_methods():
+        for method in self._listener_methods:
             method.new_suite_scope()
 
     def discard_suite_scope(self):
-        for method in self._listener_methods():
+        for method in self._listener_methods:
             method.discard_suite_scope()
 
     def set_log_level(self, level):
         self._is_logged.set_level(level)
 
     def log_message(self, msg):
-        if self._is_logged(msg.level):
+        if self._log_message and self._is_logged(msg.level):
             self._log_message(msg)
 
     def imported(self, import_type, name, attrs):
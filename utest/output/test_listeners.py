@@ -157,6 +157,10 @@ class TestListeners(unittest.TestCase):
         self.listeners.close()
         self._assert_output('Closing...')
 
+    def test_truth_value(self):
+        assert_equal(bool(self.listeners), True)
+        assert_equal(bool(Listeners([])), False)
+
     def _assert_output(self, expected):
         stdout, stderr = self.capturer._release()
         assert_equal(stderr, '')
@@ -186,6 +190,10 @@ class TestAttributesAreNotAccessedUnnecessarily(unittest.TestCase):
             listeners.log_message(Message)
             listeners.message(Message)
 
+    def test_message_level_not_checked_without_listeners(self):
+        for listeners in [Listeners([]), LibraryListeners()]:
+            listeners.log_message(None)
+
     def test_some_methods_implemented(self):
         class MyListener(object):
             ROBOT_LISTENER_API_VERSION = 2
@@ -199,5 +207,49 @@ class TestAttributesAreNotAccessedUnnecessarily(unittest.TestCase):
             assert_raises(AttributeError, listeners.end_suite, None)
 
 
+class TestArgumentsAreCreatedOncePerEvent(unittest.TestCase):
+
+    def test_attributes_shared_by_listeners(self):
+        class Recorder(object):
+            ROBOT_LISTENER_API_VERSION = 2
+            def __init__(self):
+                self.attrs = []
+            def start_test(self, name, attrs):
+                self.attrs.append(attrs)
+            def log_message(self, msg):
+                self.attrs.append(msg)
+        class Message(object):
+            timestamp = message = ''
+            level = 'INFO'
+            html = False
+        first, second = Recorder(), Recorder()
+        listeners = Listeners([first, second])
+        listeners.start_test(TestMock())
+        listeners.log_message(Message())
+        for attrs1, attrs2 in zip(first.attrs, second.attrs):
+            assert attrs1 is attrs2
+
+
+class TestRecursion(unittest.TestCase):
+
+    def test_listeners_are_not_called_recursively(self):
+        class Recursive(object):
+            ROBOT_LISTENER_API_VERSION = 2
+            def __init__(self):
+                self.calls = 0
+            def start_test(self, name, attrs):
+                self.calls += 1
+                listeners.start_test(TestMock())
+                libs.start_test(TestMock())
+        first, second = Recursive(), Recursive()
+        listeners = Listeners([first])
+        libs = LibraryListeners()
+        libs.new_suite_scope()
+        libs.register([second], None)
+        listeners.start_test(TestMock())
+        libs.start_test(TestMock())
+        assert_equal((first.calls, second.calls), (1, 1))
+
+
 if __name__ == '__main__':
     unittest.main()